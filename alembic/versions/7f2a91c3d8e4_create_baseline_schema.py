@@ -0,0 +1,112 @@
+"""Create the baseline users and expenses tables
+
+Revision ID: 7f2a91c3d8e4
+Revises:
+Create Date: 2026-08-31 09:00:00.000000
+
+The root of the migration chain: "alembic upgrade head" on a fresh
+PostgreSQL database starts here, so the later revisions always have the
+baseline schema (native expensecategory enum, float amount) to alter.
+
+SQLite dev/test databases are created from the ORM metadata at startup
+(CREATE_ALL_ON_STARTUP), so this migration is PostgreSQL-only like the
+rest of the chain.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7f2a91c3d8e4'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.create_table(
+        "users",
+        sa.Column("user_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("username", sa.String(length=100), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("hashed_password", sa.String(length=255), nullable=True),
+        sa.Column(
+            "salary", sa.Float(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.Column(
+            "is_active",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("true"),
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "expenses",
+        sa.Column("expense_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column(
+            "category",
+            sa.Enum(
+                "FOOD",
+                "TRANSPORT",
+                "ENTERTAINMENT",
+                "UTILITIES",
+                "OTHER",
+                name="expensecategory",
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("expense_id"),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.user_id"], ondelete="CASCADE"
+        ),
+    )
+    op.create_index("ix_expenses_user_id", "expenses", ["user_id"])
+    op.create_index("ix_expenses_category", "expenses", ["category"])
+    op.create_index("ix_expenses_created_at", "expenses", ["created_at"])
+    op.create_index("idx_user_created", "expenses", ["user_id", "created_at"])
+    op.create_index("idx_user_category", "expenses", ["user_id", "category"])
+    op.create_index(
+        "idx_user_created_category",
+        "expenses",
+        ["user_id", "created_at", "category"],
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.drop_table("expenses")
+    op.drop_table("users")
+    op.execute("DROP TYPE IF EXISTS expensecategory")
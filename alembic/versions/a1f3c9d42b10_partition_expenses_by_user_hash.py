@@ -0,0 +1,173 @@
+"""Partition the expenses table by HASH(user_id) on PostgreSQL
+
+Revision ID: a1f3c9d42b10
+Revises: 7f2a91c3d8e4
+Create Date: 2026-08-31 10:00:00.000000
+
+Starting from the baseline schema created by 7f2a91c3d8e4 (native
+expensecategory enum, float amount, no amount_cents), this first brings
+existing data up to the current model: category becomes a one-byte
+SMALLINT code and amount_cents is backfilled from amount.
+
+It then converts the table to hash partitioning. Partitioning limits
+budget-summary scans to one partition per user bucket so the hot part of
+each index stays in cache. PostgreSQL requires the partition key in the
+primary key, so the partitioned table uses PRIMARY KEY
+(expense_id, user_id); expense_id keeps its sequence so lookups by
+expense_id alone are unchanged.
+
+SQLite has no declarative partitioning; this migration is a no-op there
+and the ORM-defined table is used as-is.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f3c9d42b10'
+down_revision: Union[str, None] = '7f2a91c3d8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+N_PARTITIONS = 16
+
+# Mirrors CATEGORY_TO_CODE in expense_budget_app.models.expense, frozen
+# here so the migration stays valid if the model mapping ever grows; the
+# native enum stored the member names
+CATEGORY_CASE_TO_CODE = (
+    "CASE category::text "
+    "WHEN 'FOOD' THEN 0 "
+    "WHEN 'TRANSPORT' THEN 1 "
+    "WHEN 'ENTERTAINMENT' THEN 2 "
+    "WHEN 'UTILITIES' THEN 3 "
+    "ELSE 4 END"
+)
+CATEGORY_CASE_TO_NAME = (
+    "CASE category "
+    "WHEN 0 THEN 'FOOD' "
+    "WHEN 1 THEN 'TRANSPORT' "
+    "WHEN 2 THEN 'ENTERTAINMENT' "
+    "WHEN 3 THEN 'UTILITIES' "
+    "ELSE 'OTHER' END"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Baseline -> current model: one-byte category codes instead of the
+    # native enum, plus the cents shadow column summed by the services
+    op.execute(
+        "ALTER TABLE expenses ALTER COLUMN category TYPE SMALLINT "
+        f"USING ({CATEGORY_CASE_TO_CODE})"
+    )
+    op.execute("DROP TYPE IF EXISTS expensecategory")
+
+    op.execute("ALTER TABLE expenses ADD COLUMN amount_cents BIGINT")
+    op.execute("UPDATE expenses SET amount_cents = round(amount::numeric * 100)")
+    op.execute("ALTER TABLE expenses ALTER COLUMN amount_cents SET NOT NULL")
+
+    # Convert to hash partitioning
+    op.execute("ALTER TABLE expenses RENAME TO expenses_old")
+
+    op.execute("""
+        CREATE TABLE expenses (
+            expense_id BIGINT NOT NULL DEFAULT nextval('expenses_expense_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (user_id) ON DELETE CASCADE,
+            name VARCHAR(200) NOT NULL,
+            amount DOUBLE PRECISION NOT NULL,
+            amount_cents BIGINT NOT NULL,
+            category SMALLINT NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            PRIMARY KEY (expense_id, user_id)
+        ) PARTITION BY HASH (user_id)
+    """)
+
+    for i in range(N_PARTITIONS):
+        op.execute(
+            f"CREATE TABLE expenses_p{i} PARTITION OF expenses "
+            f"FOR VALUES WITH (MODULUS {N_PARTITIONS}, REMAINDER {i})"
+        )
+
+    op.execute("""
+        INSERT INTO expenses
+            (expense_id, user_id, name, amount, amount_cents, category, created_at)
+        SELECT expense_id, user_id, name, amount, amount_cents, category, created_at
+        FROM expenses_old
+    """)
+
+    # The sequence is still owned by expenses_old.expense_id; reassign it
+    # before the drop, or DROP TABLE would take the sequence (and the new
+    # table's DEFAULT) down with it
+    op.execute(
+        "ALTER SEQUENCE expenses_expense_id_seq OWNED BY expenses.expense_id"
+    )
+    op.execute("DROP TABLE expenses_old")
+
+    # Recreate the serving indexes; partitioned indexes propagate to
+    # every partition automatically
+    op.create_index("ix_expenses_user_id", "expenses", ["user_id"])
+    op.create_index("ix_expenses_category", "expenses", ["category"])
+    op.create_index("ix_expenses_created_at", "expenses", ["created_at"])
+    op.create_index("idx_user_created", "expenses", ["user_id", "created_at"])
+    op.create_index("idx_user_category", "expenses", ["user_id", "category"])
+    op.create_index(
+        "idx_user_created_cat_amt",
+        "expenses",
+        ["user_id", "created_at", "category"],
+        postgresql_include=["amount"],
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Un-partition
+    op.execute("ALTER TABLE expenses RENAME TO expenses_part")
+    op.execute("""
+        CREATE TABLE expenses (
+            expense_id BIGINT NOT NULL DEFAULT nextval('expenses_expense_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (user_id) ON DELETE CASCADE,
+            name VARCHAR(200) NOT NULL,
+            amount DOUBLE PRECISION NOT NULL,
+            category SMALLINT NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            PRIMARY KEY (expense_id)
+        )
+    """)
+    op.execute("""
+        INSERT INTO expenses
+            (expense_id, user_id, name, amount, category, created_at)
+        SELECT expense_id, user_id, name, amount, category, created_at
+        FROM expenses_part
+    """)
+    op.execute(
+        "ALTER SEQUENCE expenses_expense_id_seq OWNED BY expenses.expense_id"
+    )
+    op.execute("DROP TABLE expenses_part")
+
+    # Restore the baseline native enum
+    op.execute(
+        "CREATE TYPE expensecategory AS ENUM "
+        "('FOOD', 'TRANSPORT', 'ENTERTAINMENT', 'UTILITIES', 'OTHER')"
+    )
+    op.execute(
+        "ALTER TABLE expenses ALTER COLUMN category TYPE expensecategory "
+        f"USING ({CATEGORY_CASE_TO_NAME})::expensecategory"
+    )
+
+    op.create_index("ix_expenses_user_id", "expenses", ["user_id"])
+    op.create_index("ix_expenses_category", "expenses", ["category"])
+    op.create_index("ix_expenses_created_at", "expenses", ["created_at"])
+    op.create_index("idx_user_created", "expenses", ["user_id", "created_at"])
+    op.create_index("idx_user_category", "expenses", ["user_id", "category"])
+    op.create_index(
+        "idx_user_created_category",
+        "expenses",
+        ["user_id", "created_at", "category"],
+    )
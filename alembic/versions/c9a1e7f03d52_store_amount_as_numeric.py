@@ -0,0 +1,52 @@
+"""Store expense amounts as NUMERIC(12, 2) and drop amount_cents
+
+Revision ID: c9a1e7f03d52
+Revises: a1f3c9d42b10
+Create Date: 2026-08-31 11:00:00.000000
+
+NUMERIC(12, 2) makes the stored amount exact and lets SUM() run exactly
+in the database, so the shadow amount_cents column (and its dual-write
+on every insert/update) is no longer needed.
+
+SQLite has no ALTER COLUMN TYPE; it stores Numeric values with numeric
+affinity already and dev databases are created from the ORM metadata,
+so this migration only runs on PostgreSQL.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9a1e7f03d52'
+down_revision: Union[str, None] = 'a1f3c9d42b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE expenses ALTER COLUMN amount TYPE NUMERIC(12, 2) "
+        "USING round(amount::numeric, 2)"
+    )
+    op.drop_column("expenses", "amount_cents")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.add_column(
+        "expenses",
+        sa.Column("amount_cents", sa.BigInteger(), nullable=True),
+    )
+    op.execute("UPDATE expenses SET amount_cents = round(amount * 100)")
+    op.alter_column("expenses", "amount_cents", nullable=False)
+    op.execute(
+        "ALTER TABLE expenses ALTER COLUMN amount TYPE DOUBLE PRECISION"
+    )
@@ -7,13 +7,16 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from expense_budget_app.core.config import settings
-from expense_budget_app.core.security import create_access_token, create_refresh_token
+from expense_budget_app.core.responses import ORJSONResponse
+from expense_budget_app.core.security import create_token_pair
 from expense_budget_app.db.session import get_db
 from expense_budget_app.schemas.token import Token
 from expense_budget_app.schemas.user import UserLogin
 from expense_budget_app.services.user_service import UserService
 
-router = APIRouter()
+# Bind the response class per-router so routes skip the per-request
+# default-response lookup
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -60,13 +63,7 @@ async def login(
         )
 
     # Create tokens
-    access_token = create_access_token(
-        data={"sub": str(user.user_id), "username": user.username}
-    )
-
-    refresh_token = create_refresh_token(
-        data={"sub": str(user.user_id), "username": user.username}
-    )
+    access_token, refresh_token = create_token_pair(user.user_id, user.username)
 
     return Token(
         access_token=access_token,
@@ -119,13 +116,7 @@ async def login_json(
         )
 
     # Create tokens
-    access_token = create_access_token(
-        data={"sub": str(user.user_id), "username": user.username}
-    )
-
-    refresh_token = create_refresh_token(
-        data={"sub": str(user.user_id), "username": user.username}
-    )
+    access_token, refresh_token = create_token_pair(user.user_id, user.username)
 
     return Token(
         access_token=access_token,
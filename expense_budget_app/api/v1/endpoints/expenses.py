@@ -2,23 +2,29 @@
 Expense management endpoints
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from zlib import crc32
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import orjson
+
+from expense_budget_app.core.responses import ORJSONResponse, orjson_default
 from expense_budget_app.core.security import get_current_user_id
-from expense_budget_app.db.session import get_db
+from expense_budget_app.db.session import get_db, get_db_readonly
 from expense_budget_app.schemas.expense import (
     ExpenseCreate,
     ExpenseUpdate,
     ExpenseResponse,
-    ExpenseFilter
+    ExpenseFilterFast
 )
 from expense_budget_app.schemas.budget import BudgetSummary
 from expense_budget_app.services.expense_service import ExpenseService
-from expense_budget_app.models.expense import ExpenseCategory
+from expense_budget_app.models.expense import Expense, ExpenseCategory
 from datetime import date
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -60,7 +66,8 @@ async def create_expense(
 
 @router.get(
     "/{user_id}",
-    response_model=List[ExpenseResponse],
+    response_model=None,
+    responses={200: {"model": List[ExpenseResponse]}},
     summary="Get user's expenses",
     description="Retrieve all expenses for a user with optional filters"
 )
@@ -71,7 +78,7 @@ async def get_user_expenses(
     month: Optional[int] = Query(None, ge=1, le=12, description="Filter by month (1-12)"),
     year: Optional[int] = Query(None, ge=2000, le=2100, description="Filter by year"),
     category: Optional[ExpenseCategory] = Query(None, description="Filter by category"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     Get all expenses for a user with optional filters
@@ -91,34 +98,55 @@ async def get_user_expenses(
     Raises:
         HTTPException: If user not found or filter validation fails
     """
-    # Create filter object
-    filters = ExpenseFilter(
-        day=day,
-        week=week,
-        month=month,
-        year=year,
-        category=category
-    )
+    # Rebind already-validated query params without re-running validation
+    filters = ExpenseFilterFast(day, week, month, year, category)
+
+    # Peek the first row so the 404 decision needs no extra SELECT on the
+    # common non-empty path; only an empty result probes user existence
+    iterator = ExpenseService.iter_user_expenses(db, user_id, filters)
+    try:
+        first_expense = await anext(iterator)
+    except StopAsyncIteration:
+        await ExpenseService.verify_user_exists(db, user_id)
+        return Response(content=b"[]", media_type="application/json")
+
+    async def expense_stream():
+        yield b"[" + orjson.dumps(
+            {name: getattr(first_expense, name) for name in Expense._cols},
+            default=orjson_default
+        )
+        async for expense in iterator:
+            yield b"," + orjson.dumps(
+                {name: getattr(expense, name) for name in Expense._cols},
+                default=orjson_default
+            )
+        yield b"]"
 
-    expenses = await ExpenseService.get_user_expenses(db, user_id, filters)
-    return expenses
+    return StreamingResponse(expense_stream(), media_type="application/json")
 
 
 @router.get(
     "/detail/{expense_id}",
-    response_model=ExpenseResponse,
+    response_model=None,
+    responses={200: {"model": ExpenseResponse}},
     summary="Get expense by ID",
     description="Retrieve expense details by expense ID"
 )
 async def get_expense(
     expense_id: int,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     Get expense by ID
 
+    Expenses carry no updated_at column, so the weak ETag is a checksum of
+    the serialized row: a matching If-None-Match saves the response body,
+    though not the row fetch.
+
     Args:
         expense_id: Expense ID
+        request: Incoming request (for If-None-Match)
         db: Database session
 
     Returns:
@@ -135,7 +163,21 @@ async def get_expense(
             detail=f"Expense with ID {expense_id} not found"
         )
 
-    return expense
+    body = orjson.dumps(
+        {name: getattr(expense, name) for name in Expense._cols},
+        default=orjson_default
+    )
+    etag = f'W/"{crc32(body):x}"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    # The row is already serialized for the checksum; reuse the bytes
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
 @router.put(
@@ -201,7 +243,8 @@ async def delete_expense(
 
 @router.get(
     "/totals/{user_id}",
-    response_model=BudgetSummary,
+    response_model=None,
+    responses={200: {"model": BudgetSummary}},
     summary="Get budget summary",
     description="Get budget summary with total expenses, salary, and category breakdown"
 )
@@ -212,7 +255,7 @@ async def get_budget_summary(
     month: Optional[int] = Query(None, ge=1, le=12, description="Filter by month (1-12)"),
     year: Optional[int] = Query(None, ge=2000, le=2100, description="Filter by year"),
     category: Optional[ExpenseCategory] = Query(None, description="Filter by category"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     Get budget summary for a user
@@ -232,14 +275,8 @@ async def get_budget_summary(
     Raises:
         HTTPException: If user not found
     """
-    # Create filter object
-    filters = ExpenseFilter(
-        day=day,
-        week=week,
-        month=month,
-        year=year,
-        category=category
-    )
+    # Rebind already-validated query params without re-running validation
+    filters = ExpenseFilterFast(day, week, month, year, category)
 
     summary = await ExpenseService.get_budget_summary(db, user_id, filters)
-    return summary
+    return ORJSONResponse(summary.model_dump())
@@ -1,15 +1,29 @@
 """
 User management endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from expense_budget_app.core.responses import ORJSONResponse
 from expense_budget_app.core.security import get_current_user_id
-from expense_budget_app.db.session import get_db
+from expense_budget_app.db.session import get_db, get_db_readonly
+from expense_budget_app.models.user import User
 from expense_budget_app.schemas.user import UserCreate, UserUpdate, UserResponse
 from expense_budget_app.services.user_service import UserService
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+def _user_to_response(user) -> UserResponse:
+    """
+    Convert a trusted ORM row to UserResponse without re-validation
+    """
+    # model_construct drops columns that are not response fields
+    # (e.g. hashed_password)
+    return UserResponse.model_construct(
+        **{name: getattr(user, name) for name in User._cols}
+    )
 
 
 @router.post(
@@ -42,19 +56,25 @@ async def create_user(
 
 @router.get(
     "/{user_id}",
-    response_model=UserResponse,
+    response_model=None,
+    responses={200: {"model": UserResponse}},
     summary="Get user by ID",
     description="Retrieve user details by user ID"
 )
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     Get user by ID
 
+    Emits an ETag derived from updated_at; a matching If-None-Match header
+    short-circuits to 304 after only an indexed single-column probe.
+
     Args:
         user_id: User ID
+        request: Incoming request (for If-None-Match)
         db: Database session
 
     Returns:
@@ -63,26 +83,42 @@ async def get_user(
     Raises:
         HTTPException: If user not found
     """
-    user = await UserService.get_user_by_id(db, user_id)
+    result = await db.execute(
+        select(User.updated_at).where(User.user_id == user_id)
+    )
+    updated_at = result.scalar_one_or_none()
 
-    if not user:
+    if updated_at is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
         )
 
-    return user
+    etag = f'W/"{updated_at.timestamp()}"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    user = await UserService.get_user_by_id(db, user_id)
+
+    # Return the rendered response directly: model_dump + orjson skips
+    # FastAPI's jsonable_encoder pass
+    return ORJSONResponse(
+        _user_to_response(user).model_dump(),
+        headers={"ETag": etag}
+    )
 
 
 @router.get(
     "/me/profile",
-    response_model=UserResponse,
+    response_model=None,
+    responses={200: {"model": UserResponse}},
     summary="Get current user profile",
     description="Get the profile of the currently authenticated user"
 )
 async def get_current_user_profile(
     current_user_id: int = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     Get current authenticated user's profile
@@ -105,7 +141,7 @@ async def get_current_user_profile(
             detail="User not found"
         )
 
-    return user
+    return ORJSONResponse(_user_to_response(user).model_dump())
 
 
 @router.put(
@@ -7,11 +7,12 @@ from expense_budget_app.api.v1.endpoints import auth, users, expenses
 
 api_router = APIRouter()
 
-# Include all endpoint routers
+# Include all endpoint routers, ordered by expected hit frequency:
+# route matching iterates in insertion order
 api_router.include_router(
-    auth.router,
-    prefix="/auth",
-    tags=["Authentication"]
+    expenses.router,
+    prefix="/expenses",
+    tags=["Expenses"]
 )
 
 api_router.include_router(
@@ -21,7 +22,7 @@ api_router.include_router(
 )
 
 api_router.include_router(
-    expenses.router,
-    prefix="/expenses",
-    tags=["Expenses"]
+    auth.router,
+    prefix="/auth",
+    tags=["Authentication"]
 )
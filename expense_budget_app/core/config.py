@@ -1,15 +1,22 @@
 """
 Application Configuration using Pydantic Settings
 """
+from functools import lru_cache
 from typing import List, Optional
-from pydantic_settings import BaseSettings
-from pydantic import validator, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import field_validator
 
 
 class Settings(BaseSettings):
     """
     Application settings with environment variable support
     """
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True,
+    )
+
     # Project Info
     PROJECT_NAME: str = "Expense & Budget Management API"
     PROJECT_DESCRIPTION: str = "Track expenses, manage salary, and view budget breakdowns"
@@ -28,9 +35,18 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = ""
     DB_NAME: str = "expense_budget_db"
 
+    # Database - PgBouncer (optional, transaction-mode pooling in front of PostgreSQL)
+    PGBOUNCER_URL: Optional[str] = None
+    DB_POOL_SIZE_PER_WORKER: int = 5
+
     # Database Options
     DATABASE_ECHO: bool = False
-    DB_POOL_SIZE: int = 10
+    # Emit CREATE TABLE DDL on startup. Unset, this resolves to True for
+    # SQLite (dev/test databases come from the ORM metadata) and False
+    # for PostgreSQL, whose schema is managed by "alembic upgrade head"
+    # at deploy time
+    CREATE_ALL_ON_STARTUP: Optional[bool] = None
+    DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 20
     DB_POOL_PRE_PING: bool = True
     DB_POOL_RECYCLE: int = 3600
@@ -74,13 +90,22 @@ class Settings(BaseSettings):
         else:
             raise ValueError(f"Unsupported database type: {self.DB_TYPE}")
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the cached application settings
+
+    Environment parsing and validation run once per process; DATABASE_URL
+    is resolved here so the rest of the app can rely on it being set.
+    """
+    s = Settings()
+    if not s.DATABASE_URL:
+        # The model is frozen; bypass validation for the computed fields
+        s.__dict__["DATABASE_URL"] = s.get_database_url()
+    if s.CREATE_ALL_ON_STARTUP is None:
+        s.__dict__["CREATE_ALL_ON_STARTUP"] = s.DATABASE_URL.startswith("sqlite")
+    return s
 
-settings = Settings()
 
-# Override DATABASE_URL with constructed URL if not explicitly set
-if not settings.DATABASE_URL:
-    settings.DATABASE_URL = settings.get_database_url()
+settings = get_settings()
@@ -0,0 +1,35 @@
+"""
+orjson-backed response class with fallback encoding
+"""
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Fallback encoder for types orjson doesn't serialize natively
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson
+
+    Unlike fastapi.responses.ORJSONResponse this passes a default=
+    fallback, so Decimal and Enum values coming straight out of
+    model_dump() serialize without a jsonable_encoder pass. datetime and
+    date are handled natively by orjson.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=orjson_default)
@@ -1,37 +1,149 @@
 """
 Security utilities for JWT authentication and password hashing
 """
+import base64
+import hashlib
+import hmac
+import json
+import time
+from functools import lru_cache
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import bcrypt
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 
 from expense_budget_app.core.config import settings
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
 
+# Pre-encoded JWT header and signing key for the login hot path.
+# jwt.encode() re-serializes the header and re-reads the key on every call;
+# both are constant for the lifetime of the process.
+_HEADER_B64 = base64.urlsafe_b64encode(
+    json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode()
+).rstrip(b"=")
+_SIGNING_KEY = settings.SECRET_KEY.encode()
+
+
+def _sign(signing_input: bytes) -> bytes:
+    """
+    Compute the HS256 signature over an encoded header.payload input
+    """
+    return hmac.new(_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+
+
+def _encode_token(claims: Dict[str, Any]) -> str:
+    """
+    Encode claims as a compact HS256 JWT using the cached header prefix
+    """
+    payload_b64 = base64.urlsafe_b64encode(
+        json.dumps(claims, separators=(",", ":")).encode()
+    ).rstrip(b"=")
+    signing_input = _HEADER_B64 + b"." + payload_b64
+    signature_b64 = base64.urlsafe_b64encode(_sign(signing_input)).rstrip(b"=")
+    return (signing_input + b"." + signature_b64).decode()
+
+
+def create_token_pair(user_id: int, username: str) -> Tuple[str, str]:
+    """
+    Create an access and refresh token pair for a user
+
+    Both expiries are derived from a single clock read, and the JWT header
+    and signing key are reused from module-level constants instead of being
+    rebuilt per token.
+
+    Args:
+        user_id: User ID to embed as the token subject
+        username: Username to embed in the token payload
+
+    Returns:
+        Tuple of (access_token, refresh_token)
+    """
+    if settings.ALGORITHM != "HS256":
+        # Fall back to the generic encoder for non-default algorithms
+        data = {"sub": str(user_id), "username": username}
+        return create_access_token(data), create_refresh_token(data)
+
+    now = int(time.time())
+    access_token = _encode_token({
+        "sub": str(user_id),
+        "username": username,
+        "iat": now,
+        "exp": now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    })
+    refresh_token = _encode_token({
+        "sub": str(user_id),
+        "username": username,
+        "iat": now,
+        "exp": now + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400,
+    })
+    return access_token, refresh_token
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a plain password against a hashed password
+    Verify a plain password against a stored bcrypt hash
+
+    Calls the bcrypt C library directly; passlib's CryptContext added a
+    per-call handler lookup on top of the same primitive. Existing $2b$
+    hashes produced through passlib verify unchanged.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # Malformed/legacy hash value
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """
     Hash a password for storing
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8"),
+        bcrypt.gensalt()
+    ).decode("utf-8")
+
+
+# bcrypt releases the GIL but still burns ~100-300ms of CPU per call; a
+# dedicated executor keeps that work off the event loop and off the
+# default executor shared with other to_thread users
+_BCRYPT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="bcrypt"
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password on the bcrypt executor; await this from request
+    handlers so the event loop keeps serving other requests
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_EXECUTOR, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    get_password_hash on the bcrypt executor
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_EXECUTOR, get_password_hash, password
+    )
 
 
 def create_access_token(
@@ -107,6 +219,30 @@ def decode_token(token: str) -> Dict[str, Any]:
         )
 
 
+@lru_cache(maxsize=4096)
+def _verify_token_cached(token: str) -> Tuple[int, int]:
+    """
+    Verify a token's signature once and cache the (user_id, exp) result
+
+    Signature verification is deterministic for a given token string, so
+    consecutive requests from the same client skip the HMAC and JSON
+    parse. Only the two ints are stored per entry; expiry must be
+    re-checked by the caller on every request. Invalid tokens raise and
+    are therefore never cached.
+    """
+    payload = decode_token(token)
+    user_id = payload.get("sub")
+
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return int(user_id), int(payload.get("exp", 0))
+
+
 async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
     """
     Dependency to get current user ID from JWT token
@@ -120,14 +256,14 @@ async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
     Raises:
         HTTPException: If token is invalid or user_id not found
     """
-    payload = decode_token(token)
-    user_id: Optional[int] = payload.get("sub")
+    user_id, exp = _verify_token_cached(token)
 
-    if user_id is None:
+    # The cache skips re-verification, not expiry: enforce exp per request
+    if exp and exp < time.time():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return int(user_id)
+    return user_id
@@ -2,27 +2,63 @@
 Database session management with async support
 """
 from typing import AsyncGenerator
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
-from expense_budget_app.core.config import settings
+from expense_budget_app.core.config import get_settings
 
 
+settings = get_settings()
+
 # Determine if we're using SQLite
 is_sqlite = settings.DATABASE_URL.startswith("sqlite")
 
 # Create async engine with appropriate configuration
 if is_sqlite:
-    # SQLite doesn't support connection pooling
+    # Keep a single reusable connection instead of reconnecting per request
     engine = create_async_engine(
         settings.DATABASE_URL,
         echo=settings.DATABASE_ECHO,
         future=True,
-        poolclass=NullPool,  # Use NullPool for SQLite
+        poolclass=StaticPool,  # Reuse one connection across requests
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, connection_record):
+        """
+        Configure SQLite for concurrent access on the pooled connection
+
+        WAL lets readers proceed while a writer is active, and relaxed
+        synchronous mode avoids an fsync per transaction.
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+elif settings.PGBOUNCER_URL:
+    # PgBouncer in transaction mode multiplexes many requests onto a few
+    # PostgreSQL sockets; keep the per-worker pool small, skip liveness
+    # pings, and disable asyncpg's prepared-statement caches (prepared
+    # statements don't survive transaction-mode connection reuse)
+    engine = create_async_engine(
+        settings.PGBOUNCER_URL,
+        echo=settings.DATABASE_ECHO,
+        future=True,
+        pool_pre_ping=False,
+        pool_size=settings.DB_POOL_SIZE_PER_WORKER,
+        max_overflow=0,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        },
     )
 else:
     # PostgreSQL, MySQL, etc. support connection pooling
@@ -68,3 +104,17 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only endpoints
+
+    Skips the COMMIT round-trip that get_db issues on exit; use for GET
+    endpoints that never mutate state.
+
+    Yields:
+        AsyncSession: Database session
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -3,23 +3,28 @@ Main FastAPI Application Entry Point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
 from expense_budget_app.api.v1.router import api_router
-from expense_budget_app.core.config import settings
+from expense_budget_app.core.responses import ORJSONResponse
+from expense_budget_app.core.config import get_settings
 from expense_budget_app.db.session import engine
 from expense_budget_app.db.base import Base
 
 
+settings = get_settings()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events
     """
-    # Startup: Create database tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Startup: Create database tables (dev/test convenience only;
+    # production schema is managed by Alembic)
+    if settings.CREATE_ALL_ON_STARTUP:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
 
     yield
 
@@ -38,6 +43,7 @@ def create_application() -> FastAPI:
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url=f"{settings.API_V1_STR}/docs",
         redoc_url=f"{settings.API_V1_STR}/redoc",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
 
@@ -58,13 +64,11 @@ def create_application() -> FastAPI:
         """
         Health check endpoint
         """
-        return JSONResponse(
-            content={
-                "status": "healthy",
-                "version": settings.VERSION,
-                "service": settings.PROJECT_NAME
-            }
-        )
+        return {
+            "status": "healthy",
+            "version": settings.VERSION,
+            "service": settings.PROJECT_NAME
+        }
 
     return app
 
@@ -75,10 +79,15 @@ app = create_application()
 if __name__ == "__main__":
     import uvicorn
 
+    # Request uvloop/httptools explicitly rather than relying on uvicorn's
+    # auto-detection; both ship with uvicorn[standard]
     uvicorn.run(
         "expense_budget_app.main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
         log_level="info"
     )
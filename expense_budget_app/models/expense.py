@@ -3,16 +3,19 @@ Expense model and category enum
 """
 import enum
 from datetime import datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING
 from sqlalchemy import (
+    func,
     String,
-    Float,
+    Numeric,
     DateTime,
     ForeignKey,
-    Enum as SQLEnum,
+    SmallInteger,
     Index
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from expense_budget_app.db.base import Base
 
@@ -31,6 +34,37 @@ class ExpenseCategory(str, enum.Enum):
     OTHER = "Other"
 
 
+# Stable one-byte codes for each category; append-only so stored codes
+# never change meaning
+CATEGORY_TO_CODE = {category: code for code, category in enumerate(ExpenseCategory)}
+CODE_TO_CATEGORY = {code: category for category, code in CATEGORY_TO_CODE.items()}
+
+
+class ExpenseCategoryCode(TypeDecorator):
+    """
+    Store ExpenseCategory as a one-byte integer code
+
+    The native Enum column stored the string value (up to 13 bytes for
+    "Entertainment"), bloating every category index; a SMALLINT code packs
+    far more entries per index page. The ORM surface is unchanged:
+    attributes, filters, and query results still use ExpenseCategory.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = ExpenseCategory(value)
+        return CATEGORY_TO_CODE[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return CODE_TO_CATEGORY[value]
+
+
 class Expense(Base):
     """
     Expense model for tracking user expenses
@@ -61,20 +95,20 @@ class Expense(Base):
         nullable=False,
         comment="Expense name/description"
     )
-    amount: Mapped[float] = mapped_column(
-        Float,
+    amount: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
         nullable=False,
-        comment="Expense amount"
+        comment="Expense amount; NUMERIC keeps cents exact and sums exactly in SQL"
     )
     category: Mapped[ExpenseCategory] = mapped_column(
-        SQLEnum(ExpenseCategory),
+        ExpenseCategoryCode,
         nullable=False,
         index=True,
-        comment="Expense category"
+        comment="Expense category (stored as a one-byte code)"
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False,
         index=True,
         comment="Creation timestamp"
@@ -87,7 +121,14 @@ class Expense(Base):
     __table_args__ = (
         Index('idx_user_created', 'user_id', 'created_at'),
         Index('idx_user_category', 'user_id', 'category'),
-        Index('idx_user_created_category', 'user_id', 'created_at', 'category'),
+        # Covers the budget-summary aggregate: on PostgreSQL the INCLUDE'd
+        # amount lets SUM() run as an index-only scan with no heap fetches
+        # (other dialects ignore the INCLUDE and keep the plain index)
+        Index(
+            'idx_user_created_cat_amt',
+            'user_id', 'created_at', 'category',
+            postgresql_include=['amount'],
+        ),
     )
 
     def __repr__(self) -> str:
@@ -98,3 +139,8 @@ class Expense(Base):
             f"amount={self.amount}, "
             f"category='{self.category.value}')>"
         )
+
+
+# Column-name tuple computed once at import; row->dict conversion in the
+# response path iterates this instead of re-inspecting the mapper
+Expense._cols = tuple(c.name for c in Expense.__table__.columns)
@@ -3,7 +3,7 @@ User model
 """
 from datetime import datetime
 from typing import List, TYPE_CHECKING
-from sqlalchemy import String, Float, DateTime, Boolean
+from sqlalchemy import func, String, Float, DateTime, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from expense_budget_app.db.base import Base
@@ -66,25 +66,35 @@ class User(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False,
         comment="Creation timestamp"
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
         comment="Last update timestamp"
     )
 
-    # Relationship with expenses
+    # Relationship with expenses. lazy="raise" turns accidental traversal
+    # (which used to emit a second SELECT on every user fetch) into an
+    # error; expense queries go through ExpenseService explicitly, and
+    # passive_deletes lets the ON DELETE CASCADE FK clean up on delete
+    # without loading the collection.
     expenses: Mapped[List["Expense"]] = relationship(
         "Expense",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="raise"
     )
 
     def __repr__(self) -> str:
         return f"<User(user_id={self.user_id}, username='{self.username}', salary={self.salary})>"
+
+
+# Column-name tuple computed once at import; row->dict conversion in the
+# response path iterates this instead of re-inspecting the mapper
+User._cols = tuple(c.name for c in User.__table__.columns)
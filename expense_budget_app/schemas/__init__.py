@@ -11,7 +11,8 @@ from expense_budget_app.schemas.expense import (
     ExpenseCreate,
     ExpenseUpdate,
     ExpenseResponse,
-    ExpenseFilter
+    ExpenseFilter,
+    ExpenseFilterFast
 )
 from expense_budget_app.schemas.budget import BudgetSummary, CategoryBreakdown
 from expense_budget_app.schemas.token import Token, TokenData
@@ -25,6 +26,7 @@ __all__ = [
     "ExpenseUpdate",
     "ExpenseResponse",
     "ExpenseFilter",
+    "ExpenseFilterFast",
     "BudgetSummary",
     "CategoryBreakdown",
     "Token",
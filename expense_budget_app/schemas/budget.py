@@ -1,19 +1,28 @@
 """
 Budget summary Pydantic schemas
 """
-from typing import Dict
-from pydantic import BaseModel, Field
+from decimal import Decimal
+from typing import Annotated, Dict
+from pydantic import BaseModel, Field, PlainSerializer, RootModel
 
+# JSON output stays numeric (see the Amount alias in schemas.expense)
+_decimal_as_number = PlainSerializer(float, return_type=float, when_used="json")
 
-class CategoryBreakdown(BaseModel):
+NonNegativeAmount = Annotated[Decimal, Field(ge=0), _decimal_as_number]
+
+
+class CategoryBreakdown(RootModel[Dict[str, NonNegativeAmount]]):
     """
     Schema for category-wise expense breakdown
+
+    A RootModel over a plain dict: one value field instead of five
+    per-category float fields, so construction and serialization touch a
+    single dict and the JSON shape ({"Food": ..., ...}) is unchanged.
     """
-    Food: float = Field(default=0.0, ge=0)
-    Transport: float = Field(default=0.0, ge=0)
-    Entertainment: float = Field(default=0.0, ge=0)
-    Utilities: float = Field(default=0.0, ge=0)
-    Other: float = Field(default=0.0, ge=0)
+    root: Dict[str, NonNegativeAmount] = Field(default_factory=dict)
+
+    def __getitem__(self, category: str) -> Decimal:
+        return self.root[category]
 
     model_config = {
         "json_schema_extra": {
@@ -34,8 +43,10 @@ class BudgetSummary(BaseModel):
     """
     user_id: int = Field(..., description="User ID")
     total_salary: float = Field(..., ge=0, description="Total salary")
-    total_expense: float = Field(..., ge=0, description="Total expenses")
-    remaining_amount: float = Field(..., description="Remaining amount (salary - expenses)")
+    total_expense: NonNegativeAmount = Field(..., description="Total expenses")
+    remaining_amount: Annotated[Decimal, _decimal_as_number] = Field(
+        ..., description="Remaining amount (salary - expenses)"
+    )
     category_breakdown: CategoryBreakdown = Field(..., description="Expenses by category")
 
     model_config = {
@@ -1,12 +1,58 @@
 """
 Expense Pydantic schemas for request/response validation
 """
+from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Annotated, Any, Optional
+from pydantic import BaseModel, BeforeValidator, Field, PlainSerializer, field_validator
 
 from expense_budget_app.models.expense import ExpenseCategory
 
+_CENT = Decimal("0.01")
+
+
+def _quantize_cents(v: Any) -> Any:
+    """
+    Round incoming amounts to whole cents before validation
+
+    Runs as a BeforeValidator so sub-cent input (12.345) is rounded the
+    way the API always did, rather than tripping the decimal_places
+    constraint. Values that cannot be read as a Decimal pass through
+    untouched for pydantic to reject with its own error.
+    """
+    if isinstance(v, float):
+        v = Decimal(str(v))
+    elif isinstance(v, (int, str)):
+        try:
+            v = Decimal(v)
+        except InvalidOperation:
+            return v
+    if isinstance(v, Decimal):
+        try:
+            return v.quantize(_CENT, rounding=ROUND_HALF_UP)
+        except InvalidOperation:
+            # Too many digits (or NaN/Inf) to express in cents; the
+            # max_digits constraint reports it
+            return v
+    return v
+
+
+# Decimal must render as a JSON number on every path: pydantic's default
+# string form would make write responses disagree with the orjson-
+# serialized read endpoints (and with the pre-Decimal API)
+_decimal_as_number = PlainSerializer(float, return_type=float, when_used="json")
+
+# Amounts are exact decimals end to end: input is rounded to cents
+# first, then the digit constraints mirror the NUMERIC(12, 2) column so
+# nothing schema-valid can overflow it
+Amount = Annotated[
+    Decimal,
+    Field(gt=0, max_digits=12, decimal_places=2),
+    BeforeValidator(_quantize_cents),
+    _decimal_as_number,
+]
+
 
 class ExpenseBase(BaseModel):
     """
@@ -18,9 +64,8 @@ class ExpenseBase(BaseModel):
         max_length=200,
         description="Expense name/description"
     )
-    amount: float = Field(
+    amount: Amount = Field(
         ...,
-        gt=0,
         description="Expense amount (must be > 0)"
     )
     category: ExpenseCategory = Field(
@@ -35,13 +80,6 @@ class ExpenseCreate(ExpenseBase):
     """
     user_id: int = Field(..., gt=0, description="User ID")
 
-    @field_validator('amount')
-    @classmethod
-    def validate_amount(cls, v):
-        if v <= 0:
-            raise ValueError("Amount must be greater than 0")
-        return round(v, 2)
-
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -63,16 +101,9 @@ class ExpenseUpdate(BaseModel):
         min_length=1,
         max_length=200
     )
-    amount: Optional[float] = Field(None, gt=0)
+    amount: Optional[Amount] = None
     category: Optional[ExpenseCategory] = None
 
-    @field_validator('amount')
-    @classmethod
-    def validate_amount(cls, v):
-        if v is not None and v <= 0:
-            raise ValueError("Amount must be greater than 0")
-        return round(v, 2) if v is not None else v
-
 
 class ExpenseResponse(ExpenseBase):
     """
@@ -150,3 +181,20 @@ class ExpenseFilter(BaseModel):
             }
         }
     }
+
+
+@dataclass(slots=True, frozen=True)
+class ExpenseFilterFast:
+    """
+    Validation-free filter container for already-validated query params
+
+    FastAPI validates the query parameters before the endpoint body runs,
+    so rebinding them into a plain dataclass skips BaseModel's per-field
+    validator dispatch on every request. Use ExpenseFilter when the input
+    has not been validated yet.
+    """
+    day: Optional[date] = None
+    week: Optional[int] = None
+    month: Optional[int] = None
+    year: Optional[int] = None
+    category: Optional[ExpenseCategory] = None
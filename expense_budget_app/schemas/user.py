@@ -1,9 +1,27 @@
 """
 User Pydantic schemas for request/response validation
 """
+import re
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from typing import Annotated, Optional
+from pydantic import AfterValidator, BaseModel, Field, field_validator
+
+# Compiled once at import; a pragmatic "local@domain.tld" shape check.
+# EmailStr pulls in the email-validator package, which does IDNA and
+# deliverability parsing on every request -- far more than this API
+# needs for an optional contact field.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _validate_email(v: Optional[str]) -> Optional[str]:
+    if v is None:
+        return v
+    if not _EMAIL_RE.match(v):
+        raise ValueError("Invalid email address")
+    return v.lower()
+
+
+EmailField = Annotated[Optional[str], AfterValidator(_validate_email)]
 
 
 class UserBase(BaseModel):
@@ -16,7 +34,7 @@ class UserBase(BaseModel):
         max_length=100,
         description="Username (3-100 characters)"
     )
-    email: Optional[EmailStr] = Field(
+    email: EmailField = Field(
         None,
         description="User email address"
     )
@@ -55,7 +73,7 @@ class UserUpdate(BaseModel):
         min_length=3,
         max_length=100
     )
-    email: Optional[EmailStr] = None
+    email: EmailField = None
     salary: Optional[float] = Field(None, ge=0)
     password: Optional[str] = Field(
         None,
@@ -1,48 +1,151 @@
 """
 Expense service for business logic operations
 """
-from typing import List, Optional, Dict
-from datetime import datetime, timedelta
-from sqlalchemy import select, func, and_
+from typing import AsyncIterator, List, Optional, Dict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from time import monotonic
+from sqlalchemy import bindparam, insert, select, update, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from expense_budget_app.models.expense import Expense, ExpenseCategory
 from expense_budget_app.models.user import User
-from expense_budget_app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseFilter
+from expense_budget_app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseFilterFast
 from expense_budget_app.schemas.budget import BudgetSummary, CategoryBreakdown
 
 
+# Lookup statements built once at import; per call only the parameters are
+# bound, and the engine's compiled-SQL cache sees a stable statement
+_USER_EXISTS = select(1).where(User.user_id == bindparam("uid")).limit(1)
+_EXPENSE_BY_ID = select(Expense).where(Expense.expense_id == bindparam("eid"))
+
+# In-process TTL cache for budget summaries. The key is
+# (user_id, filters); ExpenseFilterFast is a frozen dataclass, so it
+# hashes by value. Entries for a user are dropped whenever one of their
+# expenses is written, so the TTL only bounds staleness across workers.
+_SUMMARY_CACHE: Dict[tuple, tuple] = {}
+_SUMMARY_CACHE_TTL = 30.0
+_SUMMARY_CACHE_MAX = 1024
+
+# Built once; the filter helper runs on every list/summary/totals call
+_MIDNIGHT = time.min
+_ONE_DAY = timedelta(days=1)
+_SEVEN_DAYS = timedelta(days=7)
+
+
+def invalidate_summaries(user_id: int) -> None:
+    """
+    Drop every cached summary belonging to user_id
+
+    Called from every write that can change a summary — expense writes
+    here, and user salary updates/deletions in UserService, since the
+    cached BudgetSummary embeds total_salary and the user's existence.
+    """
+    for key in [k for k in _SUMMARY_CACHE if k[0] == user_id]:
+        _SUMMARY_CACHE.pop(key, None)
+
+
 class ExpenseService:
     """
     Service class for Expense-related operations
     """
 
     @staticmethod
-    async def verify_user_exists(db: AsyncSession, user_id: int) -> User:
+    async def verify_user_exists(db: AsyncSession, user_id: int) -> None:
         """
         Verify if user exists
 
+        SELECT 1 ... LIMIT 1 probes the primary-key index without
+        fetching or hydrating the user row; callers that need user
+        columns should query them explicitly.
+
         Args:
             db: Database session
             user_id: User ID
 
-        Returns:
-            User object
-
         Raises:
             HTTPException: If user not found
         """
-        result = await db.execute(select(User).where(User.user_id == user_id))
-        user = result.scalar_one_or_none()
+        result = await db.execute(_USER_EXISTS, {"uid": user_id})
 
-        if not user:
+        if result.first() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User with ID {user_id} not found"
             )
 
-        return user
+    @staticmethod
+    def _filter_conditions(filters: Optional[ExpenseFilterFast]) -> list:
+        """
+        Build WHERE conditions for the optional expense filters
+
+        Args:
+            filters: Optional filter parameters
+
+        Returns:
+            List of SQLAlchemy filter conditions
+        """
+        conditions = []
+
+        if not filters:
+            return conditions
+
+        # Filter by day; half-open [midnight, next midnight) cannot miss
+        # sub-second timestamps the way <= 23:59:59.999999 could
+        if filters.day:
+            start_of_day = datetime.combine(filters.day, _MIDNIGHT)
+            conditions.append(
+                and_(
+                    Expense.created_at >= start_of_day,
+                    Expense.created_at < start_of_day + _ONE_DAY
+                )
+            )
+
+        # Filter by ISO week: fromisocalendar gives the true Monday of
+        # that week (the old jan-1 arithmetic drifted by up to six days),
+        # and the half-open range cannot miss sub-second timestamps
+        elif filters.week and filters.year:
+            # week=53 passes the per-field Query bounds but only exists
+            # in long ISO years; fromisocalendar raises for the rest
+            try:
+                week_monday = date.fromisocalendar(filters.year, filters.week, 1)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Year {filters.year} has no ISO week {filters.week}"
+                )
+
+            week_start = datetime.combine(week_monday, _MIDNIGHT)
+
+            conditions.append(
+                and_(
+                    Expense.created_at >= week_start,
+                    Expense.created_at < week_start + _SEVEN_DAYS
+                )
+            )
+
+        # Filter by month, half-open up to the first of the next month
+        elif filters.month and filters.year:
+            month_start = datetime(filters.year, filters.month, 1)
+
+            if filters.month == 12:
+                next_month_start = datetime(filters.year + 1, 1, 1)
+            else:
+                next_month_start = datetime(filters.year, filters.month + 1, 1)
+
+            conditions.append(
+                and_(
+                    Expense.created_at >= month_start,
+                    Expense.created_at < next_month_start
+                )
+            )
+
+        # Filter by category
+        if filters.category:
+            conditions.append(Expense.category == filters.category)
+
+        return conditions
 
     @staticmethod
     async def create_expense(
@@ -65,20 +168,77 @@ class ExpenseService:
         # Verify user exists
         await ExpenseService.verify_user_exists(db, expense_data.user_id)
 
-        # Create expense
-        db_expense = Expense(
-            user_id=expense_data.user_id,
-            name=expense_data.name,
-            amount=expense_data.amount,
-            category=expense_data.category
+        # INSERT ... RETURNING hands back the server-generated columns
+        # (expense_id, created_at) with the insert itself, so no
+        # post-commit refresh SELECT is needed
+        result = await db.scalars(
+            insert(Expense)
+            .values(
+                user_id=expense_data.user_id,
+                name=expense_data.name,
+                amount=expense_data.amount,
+                category=expense_data.category
+            )
+            .returning(Expense)
         )
-
-        db.add(db_expense)
+        db_expense = result.one()
         await db.commit()
-        await db.refresh(db_expense)
+        invalidate_summaries(db_expense.user_id)
 
         return db_expense
 
+    @staticmethod
+    async def create_expenses_bulk(
+        db: AsyncSession,
+        user_id: int,
+        expenses: List[ExpenseCreate]
+    ) -> List[Expense]:
+        """
+        Create many expenses for one user in a single transaction
+
+        One existence probe, one multi-row INSERT ... RETURNING, one
+        commit — importers and backfills pay two round-trips total
+        instead of two per expense.
+
+        Args:
+            db: Database session
+            user_id: User ID owning every expense in the batch
+            expenses: Expense creation payloads
+
+        Returns:
+            List of created Expense objects, in input order
+
+        Raises:
+            HTTPException: If user not found
+        """
+        await ExpenseService.verify_user_exists(db, user_id)
+
+        if not expenses:
+            return []
+
+        rows = [
+            {
+                "user_id": user_id,
+                "name": expense.name,
+                "amount": expense.amount,
+                "category": expense.category,
+            }
+            for expense in expenses
+        ]
+
+        # sort_by_parameter_order makes the RETURNING rows match the
+        # input batch; without it insertmanyvalues order is unspecified
+        # on PostgreSQL
+        result = await db.scalars(
+            insert(Expense).returning(Expense, sort_by_parameter_order=True),
+            rows
+        )
+        created = list(result.all())
+        await db.commit()
+        invalidate_summaries(user_id)
+
+        return created
+
     @staticmethod
     async def get_expense_by_id(
         db: AsyncSession,
@@ -94,16 +254,14 @@ class ExpenseService:
         Returns:
             Expense object or None
         """
-        result = await db.execute(
-            select(Expense).where(Expense.expense_id == expense_id)
-        )
+        result = await db.execute(_EXPENSE_BY_ID, {"eid": expense_id})
         return result.scalar_one_or_none()
 
     @staticmethod
     async def get_user_expenses(
         db: AsyncSession,
         user_id: int,
-        filters: Optional[ExpenseFilter] = None
+        filters: Optional[ExpenseFilterFast] = None
     ) -> List[Expense]:
         """
         Get all expenses for a user with optional filters
@@ -119,70 +277,99 @@ class ExpenseService:
         Raises:
             HTTPException: If user not found
         """
-        # Verify user exists
-        await ExpenseService.verify_user_exists(db, user_id)
-
         # Build query
         query = select(Expense).where(Expense.user_id == user_id)
 
         # Apply filters
-        if filters:
-            conditions = []
-
-            # Filter by day
-            if filters.day:
-                start_of_day = datetime.combine(filters.day, datetime.min.time())
-                end_of_day = datetime.combine(filters.day, datetime.max.time())
-                conditions.append(
-                    and_(
-                        Expense.created_at >= start_of_day,
-                        Expense.created_at <= end_of_day
-                    )
-                )
+        conditions = ExpenseService._filter_conditions(filters)
+        if conditions:
+            query = query.where(and_(*conditions))
 
-            # Filter by week
-            elif filters.week and filters.year:
-                # Calculate start and end of week
-                jan_1 = datetime(filters.year, 1, 1)
-                week_start = jan_1 + timedelta(weeks=filters.week - 1)
-                week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-                conditions.append(
-                    and_(
-                        Expense.created_at >= week_start,
-                        Expense.created_at <= week_end
-                    )
-                )
+        # Order by created_at descending
+        query = query.order_by(Expense.created_at.desc())
 
-            # Filter by month
-            elif filters.month and filters.year:
-                # Calculate start and end of month
-                month_start = datetime(filters.year, filters.month, 1)
-
-                if filters.month == 12:
-                    month_end = datetime(filters.year + 1, 1, 1) - timedelta(seconds=1)
-                else:
-                    month_end = datetime(filters.year, filters.month + 1, 1) - timedelta(seconds=1)
-
-                conditions.append(
-                    and_(
-                        Expense.created_at >= month_start,
-                        Expense.created_at <= month_end
-                    )
-                )
+        result = await db.execute(query)
+        expenses = list(result.scalars().all())
 
-            # Filter by category
-            if filters.category:
-                conditions.append(Expense.category == filters.category)
+        # Only an empty result needs the existence probe to distinguish
+        # "no expenses" from "no such user"
+        if not expenses:
+            await ExpenseService.verify_user_exists(db, user_id)
 
-            if conditions:
-                query = query.where(and_(*conditions))
+        return expenses
 
-        # Order by created_at descending
-        query = query.order_by(Expense.created_at.desc())
+    @staticmethod
+    async def get_totals_only(
+        db: AsyncSession,
+        user_id: int,
+        filters: Optional[ExpenseFilterFast] = None
+    ) -> tuple:
+        """
+        Get the expense total and count for a user without loading rows
 
-        result = await db.execute(query)
-        return list(result.scalars().all())
+        Callers that only need headline numbers (dashboards, pagination
+        headers) should use this instead of get_user_expenses: the
+        database returns a single aggregate row rather than every
+        matching expense.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            filters: Optional filter parameters
+
+        Returns:
+            Tuple of (total amount, expense count)
+        """
+        query = select(
+            func.coalesce(func.sum(Expense.amount), 0),
+            func.count()
+        ).where(Expense.user_id == user_id)
+
+        conditions = ExpenseService._filter_conditions(filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        total, count = (await db.execute(query)).one()
+        return Decimal(total), count
+
+    @staticmethod
+    async def iter_user_expenses(
+        db: AsyncSession,
+        user_id: int,
+        filters: Optional[ExpenseFilterFast] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[Expense]:
+        """
+        Stream a user's expenses without materializing the full list
+
+        Rows are fetched from the server cursor in batches of batch_size,
+        keeping peak memory at O(batch) instead of O(N). The caller is
+        expected to have verified the user exists (raising 404 mid-stream
+        is not possible once the response has started).
+
+        Args:
+            db: Database session
+            user_id: User ID
+            filters: Optional filter parameters
+            batch_size: Server-side fetch batch size
+
+        Yields:
+            Expense objects, newest first
+        """
+        query = select(Expense).where(Expense.user_id == user_id)
+
+        conditions = ExpenseService._filter_conditions(filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        query = (
+            query.order_by(Expense.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+
+        result = await db.stream_scalars(query)
+        async for expense in result:
+            yield expense
 
     @staticmethod
     async def update_expense(
@@ -224,11 +411,20 @@ class ExpenseService:
         # Update fields
         update_data = expense_data.model_dump(exclude_unset=True)
 
-        for field, value in update_data.items():
-            setattr(db_expense, field, value)
+        if not update_data:
+            return db_expense
 
+        # UPDATE ... RETURNING applies the change and rehydrates the row
+        # in one statement instead of a commit-then-refresh round-trip
+        result = await db.scalars(
+            update(Expense)
+            .where(Expense.expense_id == expense_id)
+            .values(**update_data)
+            .returning(Expense)
+        )
+        db_expense = result.one()
         await db.commit()
-        await db.refresh(db_expense)
+        invalidate_summaries(db_expense.user_id)
 
         return db_expense
 
@@ -269,6 +465,7 @@ class ExpenseService:
 
         await db.delete(db_expense)
         await db.commit()
+        invalidate_summaries(db_expense.user_id)
 
         return True
 
@@ -276,7 +473,7 @@ class ExpenseService:
     async def get_budget_summary(
         db: AsyncSession,
         user_id: int,
-        filters: Optional[ExpenseFilter] = None
+        filters: Optional[ExpenseFilterFast] = None
     ) -> BudgetSummary:
         """
         Get budget summary for a user
@@ -292,36 +489,67 @@ class ExpenseService:
         Raises:
             HTTPException: If user not found
         """
-        # Verify user exists and get salary
-        user = await ExpenseService.verify_user_exists(db, user_id)
-
-        # Get expenses with filters
-        expenses = await ExpenseService.get_user_expenses(db, user_id, filters)
+        cache_key = (user_id, filters)
+        cached = _SUMMARY_CACHE.get(cache_key)
+        if cached is not None and cached[0] > monotonic():
+            return cached[1]
+
+        # One round-trip: the outer join answers user existence, salary,
+        # and the grouped aggregation together. Summing the NUMERIC
+        # column is exact in the database, so no cents arithmetic is
+        # needed in Python. Filter conditions move into the join clause
+        # so a fully-filtered-out user still returns a salary row.
+        conditions = ExpenseService._filter_conditions(filters)
+        query = (
+            select(User.salary, Expense.category, func.sum(Expense.amount))
+            .outerjoin(Expense, and_(Expense.user_id == User.user_id, *conditions))
+            .where(User.user_id == user_id)
+            .group_by(User.salary, Expense.category)
+        )
+        result = await db.execute(query)
+        rows = result.all()
 
-        # Calculate total expense
-        total_expense = sum(expense.amount for expense in expenses)
+        if not rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with ID {user_id} not found"
+            )
 
-        # Calculate remaining amount
-        remaining_amount = user.salary - total_expense
+        salary = rows[0][0]
+        zero = Decimal("0.00")
 
         # Calculate category breakdown
-        category_totals: Dict[str, float] = {
-            ExpenseCategory.FOOD.value: 0.0,
-            ExpenseCategory.TRANSPORT.value: 0.0,
-            ExpenseCategory.ENTERTAINMENT.value: 0.0,
-            ExpenseCategory.UTILITIES.value: 0.0,
-            ExpenseCategory.OTHER.value: 0.0,
+        category_totals: Dict[str, Decimal] = {
+            ExpenseCategory.FOOD.value: zero,
+            ExpenseCategory.TRANSPORT.value: zero,
+            ExpenseCategory.ENTERTAINMENT.value: zero,
+            ExpenseCategory.UTILITIES.value: zero,
+            ExpenseCategory.OTHER.value: zero,
         }
 
-        for expense in expenses:
-            category_totals[expense.category.value] += expense.amount
+        for _, category, amount in rows:
+            if category is not None:
+                category_totals[category.value] = amount or zero
 
-        category_breakdown = CategoryBreakdown(**category_totals)
+        total_expense = sum(category_totals.values(), zero)
 
-        return BudgetSummary(
+        # Calculate remaining amount; salary is a float column, so it is
+        # converted through str to avoid binary-fraction artifacts
+        remaining_amount = Decimal(str(salary)) - total_expense
+
+        summary = BudgetSummary(
             user_id=user_id,
-            total_salary=user.salary,
-            total_expense=round(total_expense, 2),
-            remaining_amount=round(remaining_amount, 2),
-            category_breakdown=category_breakdown
+            total_salary=salary,
+            total_expense=total_expense,
+            remaining_amount=remaining_amount,
+            category_breakdown=CategoryBreakdown(category_totals)
         )
+
+        if len(_SUMMARY_CACHE) >= _SUMMARY_CACHE_MAX:
+            now = monotonic()
+            for key in [k for k, v in _SUMMARY_CACHE.items() if v[0] <= now]:
+                _SUMMARY_CACHE.pop(key, None)
+        if len(_SUMMARY_CACHE) < _SUMMARY_CACHE_MAX:
+            _SUMMARY_CACHE[cache_key] = (monotonic() + _SUMMARY_CACHE_TTL, summary)
+
+        return summary
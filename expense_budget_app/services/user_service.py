@@ -2,13 +2,32 @@
 User service for business logic operations
 """
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from expense_budget_app.models.user import User
+from expense_budget_app.services.expense_service import invalidate_summaries
 from expense_budget_app.schemas.user import UserCreate, UserUpdate
-from expense_budget_app.core.security import get_password_hash, verify_password
+from expense_budget_app.core.security import (
+    get_password_hash_async,
+    verify_password_async,
+)
+
+
+# Lookup statements built once at import; per call only the parameters are
+# bound, and the engine's compiled-SQL cache sees a stable statement
+_USER_BY_ID = select(User).where(User.user_id == bindparam("uid"))
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("uname"))
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+# A valid bcrypt hash of a discarded random password. authenticate_user
+# verifies against this when the username does not exist (or has no
+# password set) so a login attempt costs one bcrypt verification either
+# way and response timing does not reveal which usernames are taken.
+# Stored as a literal so importing the module costs no hashing work.
+_DUMMY_HASH = "$2b$12$SE6nCJntyxO/92VQA6MyGeCqosb24QLuzOJ.XiyEeg4Huynr778O6"
 
 
 class UserService:
@@ -28,7 +47,7 @@ class UserService:
         Returns:
             User object or None
         """
-        result = await db.execute(select(User).where(User.user_id == user_id))
+        result = await db.execute(_USER_BY_ID, {"uid": user_id})
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -43,7 +62,7 @@ class UserService:
         Returns:
             User object or None
         """
-        result = await db.execute(select(User).where(User.username == username))
+        result = await db.execute(_USER_BY_USERNAME, {"uname": username})
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -58,9 +77,47 @@ class UserService:
         Returns:
             User object or None
         """
-        result = await db.execute(select(User).where(User.email == email))
+        result = await db.execute(_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def _check_conflicts(
+        db: AsyncSession,
+        username: Optional[str] = None,
+        email: Optional[str] = None
+    ) -> set:
+        """
+        Find which of username/email are already taken, in one query
+
+        Args:
+            db: Database session
+            username: Username to check, or None to skip
+            email: Email to check, or None to skip
+
+        Returns:
+            Subset of {"username", "email"} that conflicts
+        """
+        conditions = []
+        if username:
+            conditions.append(User.username == username)
+        if email:
+            conditions.append(User.email == email)
+
+        conflicts: set = set()
+        if not conditions:
+            return conflicts
+
+        result = await db.execute(
+            select(User.username, User.email).where(or_(*conditions))
+        )
+        for row_username, row_email in result:
+            if username and row_username == username:
+                conflicts.add("username")
+            if email and row_email == email:
+                conflicts.add("email")
+
+        return conflicts
+
     @staticmethod
     async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
         """
@@ -76,39 +133,44 @@ class UserService:
         Raises:
             HTTPException: If username or email already exists
         """
-        # Check if username already exists
-        existing_user = await UserService.get_user_by_username(db, user_data.username)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Username '{user_data.username}' already exists"
-            )
-
-        # Check if email already exists (if provided)
-        if user_data.email:
-            existing_email = await UserService.get_user_by_email(db, user_data.email)
-            if existing_email:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Email '{user_data.email}' already exists"
-                )
-
         # Hash password if provided
         hashed_password = None
         if user_data.password:
-            hashed_password = get_password_hash(user_data.password)
-
-        # Create user
-        db_user = User(
-            username=user_data.username,
-            email=user_data.email,
-            hashed_password=hashed_password,
-            salary=user_data.salary
+            hashed_password = await get_password_hash_async(user_data.password)
+
+        # Create user; the unique indexes on username/email are the source
+        # of truth, so the happy path needs no pre-check SELECT and there
+        # is no check-then-insert race. RETURNING brings back the
+        # server-generated columns without a refresh SELECT.
+        stmt = (
+            insert(User)
+            .values(
+                username=user_data.username,
+                email=user_data.email,
+                hashed_password=hashed_password,
+                salary=user_data.salary
+            )
+            .returning(User)
         )
-
-        db.add(db_user)
-        await db.commit()
-        await db.refresh(db_user)
+        try:
+            result = await db.scalars(stmt)
+            db_user = result.one()
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            # Re-query only to report which field collided
+            conflicts = await UserService._check_conflicts(
+                db, user_data.username, user_data.email
+            )
+            if "username" in conflicts:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Username '{user_data.username}' already exists"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Email '{user_data.email}' already exists"
+            )
 
         return db_user
 
@@ -140,36 +202,56 @@ class UserService:
                 detail=f"User with ID {user_id} not found"
             )
 
-        # Check if new username already exists
-        if user_data.username and user_data.username != db_user.username:
-            existing_user = await UserService.get_user_by_username(db, user_data.username)
-            if existing_user:
+        # Check changed username/email uniqueness in a single round-trip
+        new_username = (
+            user_data.username
+            if user_data.username and user_data.username != db_user.username
+            else None
+        )
+        new_email = (
+            user_data.email
+            if user_data.email and user_data.email != db_user.email
+            else None
+        )
+        if new_username or new_email:
+            conflicts = await UserService._check_conflicts(db, new_username, new_email)
+            if "username" in conflicts:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Username '{user_data.username}' already exists"
+                    detail=f"Username '{new_username}' already exists"
                 )
-
-        # Check if new email already exists
-        if user_data.email and user_data.email != db_user.email:
-            existing_email = await UserService.get_user_by_email(db, user_data.email)
-            if existing_email:
+            if "email" in conflicts:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Email '{user_data.email}' already exists"
+                    detail=f"Email '{new_email}' already exists"
                 )
 
         # Update fields
         update_data = user_data.model_dump(exclude_unset=True)
 
+        if not update_data:
+            return db_user
+
         # Hash password if provided
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
-
-        for field, value in update_data.items():
-            setattr(db_user, field, value)
+            update_data["hashed_password"] = await get_password_hash_async(
+                update_data.pop("password")
+            )
 
+        # UPDATE ... RETURNING applies the change and rehydrates the row
+        # (including the onupdate timestamp) in one statement
+        result = await db.scalars(
+            update(User)
+            .where(User.user_id == user_id)
+            .values(**update_data)
+            .returning(User)
+        )
+        db_user = result.one()
         await db.commit()
-        await db.refresh(db_user)
+
+        # Cached budget summaries embed total_salary, so a user update
+        # must drop them like an expense write does
+        invalidate_summaries(user_id)
 
         return db_user
 
@@ -198,6 +280,10 @@ class UserService:
         await db.delete(db_user)
         await db.commit()
 
+        # Without this, cached summaries keep serving the deleted user
+        # until the TTL lapses
+        invalidate_summaries(user_id)
+
         return True
 
     @staticmethod
@@ -219,13 +305,16 @@ class UserService:
         """
         user = await UserService.get_user_by_username(db, username)
 
-        if not user:
-            return None
+        # Always run exactly one bcrypt verification; skipping it for
+        # unknown usernames would make them distinguishable by timing
+        if user and user.hashed_password:
+            hashed_password = user.hashed_password
+        else:
+            hashed_password = _DUMMY_HASH
 
-        if not user.hashed_password:
-            return None
+        valid = await verify_password_async(password, hashed_password)
 
-        if not verify_password(password, user.hashed_password):
-            return None
+        if user and user.hashed_password and valid:
+            return user
 
-        return user
+        return None
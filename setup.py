@@ -0,0 +1,36 @@
+"""
+Build script with optional Cython compilation of hot schema modules
+
+The request/response schemas in expense_budget_app/schemas are
+instantiated on every request. When Cython is available, they are
+compiled to extension modules so validation glue runs as native code;
+the import system prefers the built .so over the .py source. Without
+Cython the package installs as pure Python with identical behavior.
+
+Usage:
+    pip install cython && python setup.py build_ext --inplace
+"""
+from setuptools import setup, find_packages
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            "expense_budget_app/schemas/expense.py",
+            "expense_budget_app/schemas/user.py",
+            "expense_budget_app/schemas/token.py",
+            "expense_budget_app/schemas/budget.py",
+        ],
+        language_level=3,
+    )
+
+setup(
+    name="expense-budget-app",
+    version="1.0.0",
+    description="Track expenses, manage salary, and view budget breakdowns",
+    packages=find_packages(exclude=["alembic", "alembic.*"]),
+    ext_modules=ext_modules,
+)